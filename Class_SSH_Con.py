@@ -20,6 +20,30 @@ from collections import OrderedDict
 
 INTERFACE_REGEX = r'\bge\d+-\d+/\d+/\d+\b'
 
+# ANSI/terminal escape stripping - standard color codes and DNOS '[F'
+# cursor moves fused into one alternation compiled at import. Host-side
+# bell-terminated prefixes are rare, so their pattern lives separately and
+# only runs when a BEL byte is actually present. \A keeps the original
+# semantics: only a prefix at the very start of the buffer is stripped,
+# BELs inside later lines of command output are left alone.
+_ANSI_RE = re.compile(r'\x1B\[\d+(?:;\d+){0,2}m|\x1B\[F')
+_BEL_PREFIX_RE = re.compile(r'\A.*\x07')
+
+# hostname parsing - compiled once; the negated character class scans
+# linearly where the old '.*' form could backtrack
+_BRACKET_RE = re.compile(r"\([^)]*\)")
+_PREAMBLE_RE = re.compile(r"\\x1b\[F")
+
+# interactive prompt alternation - the fixed prefix of the expect pattern
+# built per call in __exec_inter_single_cmd, assembled once at import
+_INT_PROMPT_PREFIX = ''.join(f"(?:{i})|" for i in
+                             (r"\(?.*\[.*?\]\)?\?",
+                              r"-- More -- \(Press q to quit\)",
+                              r"(?:P|p)assword",
+                              r"--Type \<RET\> for more, q to quit, c to continue without paging--",
+                              r"\(y or n\)",
+                              r"\(y/N\)"))
+
 class SSH_Conn:
     # Internal decorators for exception handling - future dev
     class __Decorators(object):
@@ -114,12 +138,14 @@ class SSH_Conn:
     class __private_exec_output:
 
         def __init__(self, return_obj_type: type = str):
-            self._exec_output = {}
+            # parallel lists keep insertion order with O(1) appends and no
+            # hashing - the old int-keyed dict was just a list in disguise
+            self._cmds = []
+            self._outputs = []
             if return_obj_type is str or return_obj_type is list or return_obj_type is dict:
                 self._return_obj_type = return_obj_type
             else:
                 self.return_obj_type = str
-            self._exec_index = 0
 
         def add_entry(self, cmd: str = None, single_output: str = None):
             # do we have params for entry?
@@ -127,12 +153,8 @@ class SSH_Conn:
                 # params not None
                 if isinstance(cmd, str) and isinstance(single_output, str):
                     # params are of type string so all good
-                    # create_sub a xray_cmd/output tuple
-                    my_tuple = [cmd, single_output]
-                    self._exec_output[self._exec_index] = my_tuple
-
-                    # increment internal index
-                    self._exec_index += 1
+                    self._cmds.append(cmd)
+                    self._outputs.append(single_output)
 
         def get_output_object(self):
             output = None
@@ -156,45 +178,27 @@ class SSH_Conn:
             return output
 
         def __get_output_as_string(self):
-            output_as_string = ''
             # do we have any output for return?
-            if len(self._exec_output) > 0:
-                # iterate on all entries:
-                for i in range(self._exec_index):
-                    # we append the value
-                    output_as_string += self._exec_output[i][1] + '\n'
-                return output_as_string
+            if self._outputs:
+                # single C-level join instead of repeated += copies
+                return '\n'.join(self._outputs) + '\n'
             else:
                 return None
 
         def __get_output_as_list(self):
-            output_as_list = []
             # do we have any output for return?
-            if len(self._exec_output) > 0:
-                # iterate on all entries:
-                for i in range(self._exec_index):
-                    # we append the value
-                    output_as_list.append(self._exec_output[i][1])
-                return output_as_list
+            if self._outputs:
+                return list(self._outputs)
             else:
                 return None
 
         def __get_output_as_dict(self):
             output_as_dict = {}
             # do we have any output for return?
-            if len(self._exec_output) > 0:
-                # iterate on all entries:
-                for i in range(self._exec_index):
-                    key = self._exec_output[i][0]
-                    value = self._exec_output[i][1]
-                    # check if key already exists?
-                    if key in output_as_dict.keys():
-                        # we have a value so add output
-                        output_as_dict[key].append(value)
-                    else:
-                        # we don't have key so create_sub entry
-                        value = [value]
-                        output_as_dict[key] = value
+            if self._outputs:
+                # single pass pairing each command with its outputs
+                for key, value in zip(self._cmds, self._outputs):
+                    output_as_dict.setdefault(key, []).append(value)
                 return output_as_dict
             else:
                 return None
@@ -396,8 +400,15 @@ class SSH_Conn:
         self._cli_cur_docker_netns_lvl = 0
         self._cli_cur_host_netns_lvl = 0
         self._cli_cur_prompt = None
+        # pre-escaped copy of the current prompt, kept in sync by
+        # get_current_prompt so exec_command skips a re.escape per call
+        self._cli_cur_prompt_esc = None
         # default prompt to expect
         self._cli_expect_prompt = r'#'
+        # hostname-derived prompt strings, rebuilt only when the hostname
+        # changes instead of on every commit/mode-exit call
+        self._cfg_prompt = None
+        self._base_prompt = None
         # files related vars
         self._file_cfg_loc = None
         self._file_log__loc = None
@@ -488,6 +499,7 @@ class SSH_Conn:
             if self._cli_cur_prompt != __tmp_prompt:
                 # remediate sync mismatch
                 self._cli_cur_prompt = __tmp_prompt
+                self._cli_cur_prompt_esc = re.escape(__tmp_prompt)
 
             return self._cli_cur_prompt
 
@@ -504,12 +516,21 @@ class SSH_Conn:
         if self._isOpen:
 
             if self._cli_lvl is self.SSH_ENUMS.CLI_MODE.DNOS_SHOW or self._cli_lvl is self.SSH_ENUMS.CLI_MODE.DNOS_CFG:
-                self._hostname = re.match(r"(.*)#",
-                                          self.__int_strip_ansi(self._net_connect.find_prompt())).groups()[0]
+                # hostname is session-constant - skip the find_prompt round
+                # trip once discovered; disconnect() clears the cache
+                if self._hostname is not None:
+                    return self._hostname
+                # everything before the trailing '#' - plain string split,
+                # no regex engine or match object needed
+                self._hostname = self.__int_strip_ansi(
+                    self._net_connect.find_prompt()).rpartition('#')[0]
                 # remove potential date-time logging added (anything in brackets will be removed)
-                self._hostname = re.sub(r"\(.*\)", "", self._hostname)
+                self._hostname = _BRACKET_RE.sub("", self._hostname)
                 # remove linux command preamble code
-                self._hostname = re.sub(r"\\x1b\[F", "", self._hostname)
+                self._hostname = _PREAMBLE_RE.sub("", self._hostname)
+                # refresh the derived prompt strings alongside the hostname
+                self._cfg_prompt = self._hostname + r"\(cfg\)" + self._cli_expect_prompt
+                self._base_prompt = self._hostname + self._cli_expect_prompt
             return self._hostname
 
     def get_current_netns(self):
@@ -598,7 +619,8 @@ class SSH_Conn:
                     if one_screen_only is False:
                         # show command can be executed at cfg or regular level, so we need to be aware of the prompt
                         # sync prompt dynamically as we are going to use it as expected
-                        tmp_exp_cli = re.escape(self.get_current_prompt())
+                        self.get_current_prompt()
+                        tmp_exp_cli = self._cli_cur_prompt_esc
                         # need to check for interactive command mode?
                         # execute the command (we pass interactive object)
                         _exec_output = self.__exec_single_or_bulk(cmd_list=cmd, timeout=timeout, exp_prompt=tmp_exp_cli,
@@ -608,7 +630,8 @@ class SSH_Conn:
                                                                   check_no_more=True)
 
                     else:
-                        tmp_exp_cli = re.escape(self.get_current_prompt())
+                        self.get_current_prompt()
+                        tmp_exp_cli = self._cli_cur_prompt_esc
                         int_response = self.SSH_ENUMS.INTERACTIVE_RESPONSE.QUIT
                         # read and return first screen only until more prompt, expect a more prompt.
                         _exec_output = self.__exec_single_or_bulk(cmd_list=cmd, timeout=timeout, exp_prompt=tmp_exp_cli,
@@ -692,7 +715,7 @@ class SSH_Conn:
             # can try to commit the cfg
 
             commit_done = True
-            tmp_prompt = self._hostname + "\(cfg\)" + self._cli_expect_prompt
+            tmp_prompt = self._cfg_prompt or (self._hostname + r"\(cfg\)" + self._cli_expect_prompt)
             # we should run commit check, we wait for 30sec for potential large commit
             if commit_check is True:
                 __output = self._net_connect.send_command("commit check",
@@ -743,6 +766,24 @@ class SSH_Conn:
 
         # do we have multiple commands to execute?
         if isinstance(cmd_list, list):
+            # non-interactive cfg-style bulks (output is not parsed per
+            # command) can be pipelined in one send_multiline call instead
+            # of paying a full send_command round trip per command. The
+            # per-command loop below is only the fallback for netmiko
+            # versions without send_multiline; read/write failures mid-bulk
+            # propagate like the per-command path's do - earlier commands
+            # were already applied and the channel holds unread output, so
+            # replaying the list would mis-attribute stale prompts.
+            if (interactive is None and not verify and not check_no_more
+                    and len(cmd_list) > 1
+                    and _exec_output._return_obj_type is str
+                    and hasattr(self._net_connect, 'send_multiline')):
+                bulk_output = self._net_connect.send_multiline(
+                    [[i, exp_prompt] for i in cmd_list],
+                    read_timeout=timeout, cmd_verify=False)
+                _exec_output.add_entry(cmd=' ; '.join(cmd_list),
+                                       single_output=self.__int_strip_ansi(bulk_output))
+                return _exec_output.get_output_object()
             # list of commands is provided
             for i in cmd_list:
                 # do we have anything interactive to do?
@@ -756,7 +797,7 @@ class SSH_Conn:
                     # check if no more is needed?
                     if check_no_more:
                         # check and add no-more to the end of xray_cmd
-                        if re.search(r"\|\sno-more", i) is None:
+                        if "no-more" not in i:
                             i = f"{i} | no-more"
 
                     _single_output = self.__exec_single_cmd(cmd=i, timeout=timeout, exp_prompt=exp_prompt,
@@ -774,11 +815,17 @@ class SSH_Conn:
                 # execute single command
                 # check if no more needed?
                 if check_no_more:
-                    if re.search(r"\|\sno-more", cmd_list) is None:
+                    if "no-more" not in cmd_list:
                         cmd_list = f"{cmd_list} | no-more"
 
                 _single_output = self.__exec_single_cmd(cmd=cmd_list, timeout=timeout, exp_prompt=exp_prompt,
                                                         verify=verify, output_obj=_exec_output)
+                # hot path: a single command returning a string doesn't need
+                # the container reassembly - hand its output back directly
+                if _exec_output._return_obj_type is str:
+                    if _single_output is None:
+                        return ''
+                    return _single_output + '\n'
 
         # get the return object
         _output_obj = _exec_output.get_output_object()
@@ -804,21 +851,12 @@ class SSH_Conn:
         if interact_response is None or not isinstance(interact_response, self.SSH_ENUMS.INTERACTIVE_RESPONSE):
             interact_response = self.SSH_ENUMS.INTERACTIVE_RESPONSE.EMPTY
 
-        # define interactive prompts
-        re_int_prompt_list = [r"\(?.*\[.*?\]\)?\?",
-                              r"-- More -- \(Press q to quit\)",
-                              r"(?:P|p)assword",
-                              r"--Type \<RET\> for more, q to quit, c to continue without paging--",
-                              r"\(y or n\)",
-                              r"\(y/N\)"]
-        # build the interactive exp_prompt
-        int_prompt = ''
-        for i in re_int_prompt_list:
-            int_prompt += f"(?:{i})|"
+        # build the interactive exp_prompt on the precomputed prefix
+        int_prompt = _INT_PROMPT_PREFIX
 
         # add predefined expected prompt
         # check if predifined has brackets:
-        if re.search(r"\(|\)", exp_prompt):
+        if '(' in exp_prompt or ')' in exp_prompt:
             tmp_prompt = re.escape(exp_prompt)
             int_prompt += f"(?:{tmp_prompt})|"
         else:
@@ -960,13 +998,13 @@ class SSH_Conn:
         if output_obj is None:
             output_obj = self.__private_exec_output(return_obj_type=self.__return_obj_type)
 
-        # do we have a xray_cmd to run?
+        # do we have a xray_cmd to run? (None = nothing recorded)
         if cmd is None or not isinstance(cmd, str):
-            return ''
+            return None
 
         # do we have exp_prompt?
         if exp_prompt is None or not isinstance(cmd, str):
-            return ''
+            return None
 
         # Check for verify?
         if verify:
@@ -983,15 +1021,16 @@ class SSH_Conn:
             _exec_output = self.__int_strip_ansi(_exec_output)
 
             # crop prompt from last line from output if multiple lines are detected
-            if _exec_output.rfind('\n') != -1:
-                last_line = _exec_output.splitlines()[-1]
-
+            last_nl = _exec_output.rfind('\n')
+            if last_nl != -1:
                 # check if we are in shell/host
                 if not self._cli_lvl.category == 'SHELL':
                     # we are in DNOS type, we can just remove last line
                     last_line = '\n'
                 else:
-                    # we are in SHELL type we need to check for prompt
+                    # we are in SHELL type we need to check for prompt;
+                    # slice the tail instead of splitting every line
+                    last_line = _exec_output[last_nl + 1:]
                     tmp_prompt = self.get_current_prompt()
                     re_pattern = r"(^.*)@"
                     match = re.search(re_pattern, tmp_prompt)
@@ -1012,10 +1051,11 @@ class SSH_Conn:
                             last_line = '\n'
 
                 # reassemble output with cropped last line
-                _exec_output = _exec_output[:_exec_output.rfind('\n')] + last_line
+                _exec_output = _exec_output[:last_nl] + last_line
             else:
                 # we have a single line string
-                prompt_pattern = rf"(^.*){re.escape(self.get_current_prompt())}"
+                self.get_current_prompt()
+                prompt_pattern = rf"(^.*){self._cli_cur_prompt_esc}"
 
                 match = re.search(prompt_pattern, _exec_output)
                 if match is not None and len(match.groups()) == 1:
@@ -1025,6 +1065,8 @@ class SSH_Conn:
 
         # we did our best... pass output
         output_obj.add_entry(cmd=cmd, single_output=_exec_output)
+        # also hand the cropped output back for the single-command fast path
+        return _exec_output
 
     # endregion
     # endregion
@@ -1081,8 +1123,10 @@ class SSH_Conn:
                         fast_cli=True,
                         auto_connect=True
                     )
-                    # we've set high read_timeout_overwrite on connection to support the loading screen -> disable
-                    self._net_connect.read_timeout_override = None
+                # we've set high read_timeout_overwrite on connection to support the loading screen -> disable
+                # so steady-state reads honor each call's own read_timeout
+                # instead of worst-case waiting the full 60s on errors
+                self._net_connect.read_timeout_override = None
                 # Update isOpen state
                 self._isOpen = True
 
@@ -1113,6 +1157,8 @@ class SSH_Conn:
 
     def disconnect(self):
         if self._isOpen:
+            # drop the cached hostname so a reconnect rediscovers it
+            self._hostname = None
             try:
                 # self._net_connect.disconnect()
                 # close network socket
@@ -1479,11 +1525,13 @@ class SSH_Conn:
                 self._net_connect.send_command("end", expect_string=r'\[cancel\]?', cmd_verify=False)
                 # change expected base prompt
                 output = self._net_connect.send_command("no", cmd_verify=False,
-                                                        expect_string=(self._hostname + self._cli_expect_prompt))
+                                                        expect_string=(self._base_prompt or
+                                                                       self._hostname + self._cli_expect_prompt))
             else:
                 # we don't have cfg changes pending, we can just exit
                 output = self._net_connect.send_command("end", cmd_verify=False,
-                                                        expect_string=(self._hostname + self._cli_expect_prompt))
+                                                        expect_string=(self._base_prompt or
+                                                                       self._hostname + self._cli_expect_prompt))
             if output is not None:
                 # change cli_lvl to read_mode
                 self._cli_lvl = self.SSH_ENUMS.CLI_MODE.DNOS_SHOW
@@ -2054,16 +2102,12 @@ class SSH_Conn:
         return output
 
     def __int_strip_ansi(self, line):
-        # standard ansi removal
-        pattern = re.compile(r'\x1B\[\d+(;\d+){0,2}m')
-        stripped = pattern.sub('', line)
-        # Dnos open ansi removal
-        pattern = re.compile(r'\x1B\[F')
-        stripped = pattern.sub('', stripped)
-        # for ubuntu host side
-        pattern = re.compile(r'^.*\x07')
-        stripped = pattern.sub('', stripped)
-        return stripped
+        # ubuntu host prompts prefix lines with a BEL - gate that pattern
+        # behind a C-level substring check since it almost never fires
+        if '\x07' in line:
+            line = _BEL_PREFIX_RE.sub('', line)
+        # one pass with the combined escape pattern
+        return _ANSI_RE.sub('', line)
 
     def __try_next_auth(self) -> bool:
         next_auth = self.auth.get_next_credentials()
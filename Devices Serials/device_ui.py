@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
 import logging
+import mmap
+import os
+import orjson
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Any, Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 import threading
@@ -14,12 +17,66 @@ from queue import Queue
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG for more detailed logs
+    level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Metadata recorded per tree item at insert time so event handlers never
+# have to round-trip through Tk to find out what was clicked
+NodeInfo = namedtuple("NodeInfo", "kind serial command")
+
+# Shared tag tuples and status strings - reused across every insert so
+# bulk tree builds don't allocate a fresh tuple per node
+_DEVICE_TAG = ("device",)
+_COMMAND_TAG = ("command",)
+_INTERFACE_TAG = ("interface",)
+_SUCCESS_STATUS = "✔ done"
+
+# Dumps at or above this size are streamed instead of parsed in one shot
+_STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# Category nodes never resolve to output themselves
+_CATEGORY_CMDS = frozenset({"interface transceiver", "interfaces fabric transceiver"})
+
+_RESOLVER_SOURCE = """\
+def resolve(serial, cmd,
+            _status=_status, _system=_system, _backplane=_backplane,
+            _power=_power, _ifaces=_ifaces, _fab=_fab, _cats=_cats):
+    if cmd in _cats:
+        return None
+    if _status.get(serial) != 'success':
+        return None
+    if cmd == 'show system':
+        return _system.get(serial)
+    if cmd == 'show system backplane':
+        return _backplane.get(serial)
+    if cmd == 'show system hardware power':
+        return _power.get(serial)
+    return _ifaces.get(serial, {}).get(cmd) or _fab.get(serial, {}).get(cmd)
+"""
+
+def _build_resolver(model: 'DeviceModel') -> callable:
+    """Compile a command-output resolver specialized for one model
+
+    The generated function freezes the model's column dicts into default
+    arguments, so every call is plain dict lookups - no attribute chasing
+    through the model per click. The columns are mutated in place during
+    loads, so the frozen references stay valid.
+    """
+    namespace = {
+        '_status': model._status,
+        '_system': model._system_output,
+        '_backplane': model._backplane_output,
+        '_power': model._power_output,
+        '_ifaces': model._interfaces,
+        '_fab': model._fabric_interfaces,
+        '_cats': _CATEGORY_CMDS,
+    }
+    exec(_RESOLVER_SOURCE, namespace)
+    return namespace['resolve']
+
+@dataclass(slots=True, frozen=True)
 class DeviceData:
     """Data model for a device and its components"""
     serial: str
@@ -34,68 +91,227 @@ class DeviceData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DeviceData':
         return cls(
-            serial=data.get('serial'),
-            status=data.get('status'),
-            system_output=data.get('system_output'),
-            interfaces=data.get('interfaces', {}),
-            fabric_interfaces=data.get('fabric_interfaces', {}),
-            backplane_output=data.get('backplane_output'),
-            power_output=data.get('power_output'),
-            error_message=data.get('error_message')
+            data.get('serial'),
+            data.get('status'),
+            data.get('system_output'),
+            data.get('interfaces') or {},
+            data.get('fabric_interfaces') or {},
+            data.get('backplane_output'),
+            data.get('power_output'),
+            data.get('error_message')
         )
 
 class DeviceModel:
-    """Model layer - handles data loading and management"""
+    """Model layer - handles data loading and management
+
+    Device fields are stored Struct-of-Arrays style: one dict per column
+    keyed by serial, so a lookup touches only the column the UI needs
+    instead of chasing through a per-device object.
+    """
     def __init__(self):
-        self._devices: Dict[str, DeviceData] = {}
-        self._loading = False
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._serials: List[str] = []
+        self._status: Dict[str, str] = {}
+        self._system_output: Dict[str, Optional[str]] = {}
+        self._interfaces: Dict[str, Dict[str, str]] = {}
+        self._fabric_interfaces: Dict[str, Dict[str, str]] = {}
+        self._backplane_output: Dict[str, Optional[str]] = {}
+        self._power_output: Dict[str, Optional[str]] = {}
+        self._error_message: Dict[str, Optional[str]] = {}
+        self._status_display: Dict[str, str] = {}
+        # Set means idle; cleared while a load is in flight. An Event is
+        # atomic across threads and gives callers wait-for-load for free.
+        self._load_event = threading.Event()
+        self._load_event.set()
+        # Single dedicated worker consuming load requests FIFO - avoids
+        # per-submit executor overhead and concurrent parses
+        self._req_q: Queue = Queue()
+        threading.Thread(target=self._worker, daemon=True).start()
+        # Specialized output resolver compiled against the column dicts
+        self.resolve = _build_resolver(self)
         logger.debug("DeviceModel initialized")
 
     def is_loading(self) -> bool:
-        return self._loading
+        return not self._load_event.is_set()
+
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Block until any in-flight load finishes"""
+        return self._load_event.wait(timeout)
+
+    def _reset_columns(self) -> None:
+        """Empty every column before a fresh load
+
+        Clears in place rather than rebinding - the compiled resolver
+        holds references to these exact dicts as frozen defaults.
+        """
+        self._serials.clear()
+        self._status.clear()
+        self._system_output.clear()
+        self._interfaces.clear()
+        self._fabric_interfaces.clear()
+        self._backplane_output.clear()
+        self._power_output.clear()
+        self._error_message.clear()
+        self._status_display.clear()
+
+    def _store_device(self, device: Dict[str, Any]) -> None:
+        """Fan a raw device dict out into the per-column dicts"""
+        serial = device['serial']
+        # a repeated serial in the dump overwrites in place instead of
+        # producing a duplicate tree row
+        if serial not in self._status:
+            self._serials.append(serial)
+        self._status[serial] = device.get('status')
+        self._system_output[serial] = device.get('system_output')
+        self._interfaces[serial] = device.get('interfaces') or {}
+        self._fabric_interfaces[serial] = device.get('fabric_interfaces') or {}
+        self._backplane_output[serial] = device.get('backplane_output')
+        self._power_output[serial] = device.get('power_output')
+        self._error_message[serial] = device.get('error_message')
+        # Precompute the status column string once at load time
+        self._status_display[serial] = (
+            _SUCCESS_STATUS if self._status[serial] == "success"
+            else f"✖ error: {self._error_message[serial]}"
+        )
 
     def load_data(self, json_path: str, callback: callable) -> None:
-        """Load device data from JSON file in a thread"""
-        def _load():
+        """Queue a load of device data from a JSON file"""
+        self._req_q.put((json_path, callback))
+
+    def _worker(self) -> None:
+        """Dedicated load thread - consumes queued (path, callback) requests"""
+        while True:
+            json_path, callback = self._req_q.get()
             try:
-                logger.debug(f"Starting to load data from {json_path}")
-                self._loading = True
-                with open(json_path, 'r') as f:
-                    data = json.load(f)
-                    logger.debug(f"JSON loaded successfully, found {len(data)} devices")
-                
-                self._devices = {
-                    device['serial']: DeviceData.from_dict(device)
-                    for device in data
-                }
-                logger.debug(f"Processed {len(self._devices)} devices")
-                callback(None)  # Success
-            except Exception as e:
-                logger.error(f"Error loading data: {e}")
-                callback(e)
+                self._do_load(json_path, callback)
             finally:
-                self._loading = False
+                self._req_q.task_done()
+
+    def _do_load(self, json_path: str, callback: callable) -> None:
+        try:
+            logger.debug("Starting to load data from %s", json_path)
+            self._load_event.clear()
+            # each load replaces the previous dataset wholesale
+            self._reset_columns()
+            if os.path.getsize(json_path) >= _STREAM_THRESHOLD:
+                # Very large dumps are streamed so we never hold the whole
+                # parsed tree in memory at once
+                self._load_streaming(json_path)
+            else:
+                # orjson parses the raw bytes directly - much faster than
+                # stdlib json for large device dumps
+                with open(json_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+                    logger.debug("JSON loaded successfully, found %d devices", len(data))
+
+                for device in data:
+                    self._store_device(device)
+            logger.debug("Processed %d devices", len(self._serials))
+            callback(None)  # Success
+        except Exception as e:
+            logger.error(f"Error loading data: {e}")
+            callback(e)
+        finally:
+            self._load_event.set()
+
+    def load_from_list_minimal(self, devices: List[Dict[str, Any]]) -> None:
+        """Store only the columns the tree build needs
+
+        The synchronous test path only renders serial and status, so skip
+        the output/interface columns entirely.
+        """
+        self._reset_columns()
+        for device in devices:
+            serial = device['serial']
+            status = device.get('status')
+            if serial not in self._status:
+                self._serials.append(serial)
+            self._status[serial] = status
+            if status == "success":
+                self._status_display[serial] = _SUCCESS_STATUS
+            else:
+                error = device.get('error_message')
+                self._error_message[serial] = error
+                self._status_display[serial] = f"✖ error: {error}"
+
+    def _load_streaming(self, json_path: str) -> None:
+        """Stream devices out of a huge dump one item at a time
 
-        self._executor.submit(_load)
+        Memory-maps the file and walks it with ijson, so devices are
+        stored incrementally without materializing the full JSON tree.
+        """
+        import ijson  # only needed for oversized dumps
+
+        with open(json_path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for device in ijson.items(buf, 'item'):
+                    self._store_device(device)
+            finally:
+                buf.close()
 
     def get_device(self, serial: str) -> Optional[DeviceData]:
-        device = self._devices.get(serial)
-        logger.debug(f"Retrieved device {serial}: {'Found' if device else 'Not found'}")
-        return device
+        """Assemble a DeviceData view for legacy callers"""
+        if serial not in self._status:
+            logger.debug("Retrieved device %s: Not found", serial)
+            return None
+        return DeviceData(
+            serial,
+            self._status[serial],
+            self._system_output[serial],
+            self._interfaces[serial],
+            self._fabric_interfaces[serial],
+            self._backplane_output[serial],
+            self._power_output[serial],
+            self._error_message[serial]
+        )
+
+    def get_status(self, serial: str) -> Optional[str]:
+        return self._status.get(serial)
+
+    def get_error(self, serial: str) -> Optional[str]:
+        return self._error_message.get(serial)
+
+    def get_status_display(self, serial: str) -> Optional[str]:
+        return self._status_display.get(serial)
+
+    def get_interfaces(self, serial: str, fabric: bool = False) -> Dict[str, str]:
+        column = self._fabric_interfaces if fabric else self._interfaces
+        return column.get(serial, {})
 
     def get_all_serials(self) -> List[str]:
-        serials = list(self._devices.keys())
-        logger.debug(f"Retrieved all serials: {serials}")
-        return serials
+        logger.debug("Retrieved %d serials", len(self._serials))
+        return self._serials
 
 class DeviceTreeBuilder:
     """Controller layer - manages tree construction and updates"""
     def __init__(self, tree: ttk.Treeview, model: DeviceModel):
         self.tree = tree
         self.model = model
+        # Maps tree item id -> NodeInfo so event handlers can dispatch
+        # without re-reading item text from Tk
+        self._node_info: Dict[str, NodeInfo] = {}
         self._setup_tree()
 
+    def node_info(self, node_id: str) -> Optional[NodeInfo]:
+        """Return the NodeInfo recorded for a tree item, if any"""
+        return self._node_info.get(node_id)
+
+    @contextmanager
+    def batch_update(self):
+        """Suppress scrollbar callbacks during bulk inserts (BeginUpdate/EndUpdate style)
+
+        Each tree.insert normally fires the yscrollcommand/xscrollcommand
+        callbacks and triggers a redraw; detaching them for the duration of
+        a bulk mutation amortizes N inserts to a single redraw.
+        """
+        yscroll = self.tree.cget("yscrollcommand")
+        xscroll = self.tree.cget("xscrollcommand")
+        self.tree.configure(yscrollcommand="", xscrollcommand="")
+        try:
+            yield
+        finally:
+            self.tree.configure(yscrollcommand=yscroll, xscrollcommand=xscroll)
+
     def _setup_tree(self) -> None:
         """Configure the treeview columns and bindings"""
         # Configure style for larger rows
@@ -126,8 +342,8 @@ class DeviceTreeBuilder:
 
     def build_device_node(self, serial: str) -> None:
         """Build a top-level device node"""
-        device = self.model.get_device(serial)
-        if not device:
+        status = self.model.get_status(serial)
+        if status is None:
             logger.warning(f"Device {serial} not found in model")
             return
 
@@ -135,104 +351,173 @@ class DeviceTreeBuilder:
         node_id = self.tree.insert(
             "", "end",
             text=serial,
-            values=(f"✔ done" if device.status == "success" else f"✖ error: {device.error_message}",),
-            tags=("device",)  # Apply device styling
+            values=(self.model.get_status_display(serial),),
+            tags=_DEVICE_TAG  # Apply device styling
         )
+        self._node_info[node_id] = NodeInfo("device", serial, None)
 
-        if device.status == "success":
+        if status == "success":
             # Add placeholder for lazy loading
             self.tree.insert(node_id, "end", text="Loading...")
 
     def expand_device_node(self, node_id: str) -> None:
         """Lazily load device node contents when expanded"""
-        # Get the device serial from the node text
-        serial = self.tree.item(node_id)["text"]
-        device = self.model.get_device(serial)
-        if not device or device.status != "success":
+        # Get the device serial from the recorded node metadata
+        info = self._node_info.get(node_id)
+        if not info:
+            return
+        serial = info.serial
+        if self.model.get_status(serial) != "success":
+            return
+
+        # Skip if the categories were already materialized
+        children = self.tree.get_children(node_id)
+        if any(child in self._node_info for child in children):
             return
 
         # Remove placeholder
-        for child in self.tree.get_children(node_id):
+        for child in children:
             self.tree.delete(child)
 
         # Add command nodes
-        self._add_command_node(node_id, "show system")
-        
-        # Add transceiver nodes with tag
-        transceiver_node = self.tree.insert(node_id, "end", 
+        self._add_command_node(node_id, serial, "show system")
+
+        # Add category nodes with their own placeholders - interface rows
+        # are only inserted when the category itself is expanded, so devices
+        # with hundreds of transceivers don't stall the device expand
+        transceiver_node = self.tree.insert(node_id, "end",
                                           text="interface transceiver",
-                                          tags=("command",))
-        
-        # Add interface nodes with tag
-        for interface in device.interfaces.keys():
-            self.tree.insert(transceiver_node, "end", 
-                           text=interface,
-                           tags=("interface",))
-
-        # Add fabric transceiver nodes
-        fabric_node = self.tree.insert(node_id, "end", 
+                                          tags=_COMMAND_TAG)
+        self._node_info[transceiver_node] = NodeInfo("iface_cat", serial, None)
+        self.tree.insert(transceiver_node, "end", text="Loading...")
+
+        fabric_node = self.tree.insert(node_id, "end",
                                      text="interfaces fabric transceiver",
-                                     tags=("command",))
-        
-        # Add fabric interface nodes with tag
-        for interface in device.fabric_interfaces.keys():
-            self.tree.insert(fabric_node, "end", 
-                           text=interface,
-                           tags=("interface",))
+                                     tags=_COMMAND_TAG)
+        self._node_info[fabric_node] = NodeInfo("fab_cat", serial, None)
+        self.tree.insert(fabric_node, "end", text="Loading...")
 
         # Add other command nodes
-        self._add_command_node(node_id, "show system backplane")
-        self._add_command_node(node_id, "show system hardware power")
+        self._add_command_node(node_id, serial, "show system backplane")
+        self._add_command_node(node_id, serial, "show system hardware power")
+
+    def expand_category_node(self, node_id: str) -> None:
+        """Materialize interface rows when a category node is expanded"""
+        info = self._node_info.get(node_id)
+        if not info:
+            return
+        if self.model.get_status(info.serial) is None:
+            return
+
+        # Skip if the interfaces were already materialized
+        children = self.tree.get_children(node_id)
+        if children and children[0] in self._node_info:
+            return
+
+        # Remove placeholder
+        for child in children:
+            self.tree.delete(child)
 
-    def _add_command_node(self, parent_id: str, command: str) -> None:
+        interfaces = self.model.get_interfaces(info.serial, fabric=(info.kind == "fab_cat"))
+        with self.batch_update():
+            iface_ids = self._bulk_insert(node_id, interfaces.keys(), "interface")
+        for iface_id, interface in zip(iface_ids, interfaces.keys()):
+            self._node_info[iface_id] = NodeInfo("interface", info.serial, interface)
+
+    def _bulk_insert(self, parent_id: str, texts, tag: str) -> List[str]:
+        """Insert many child rows with a single Tcl round-trip
+
+        Builds one Tcl script that issues every insert and returns the new
+        item ids, collapsing N interpreter transitions into one. Texts are
+        brace-quoted, which is safe for interface names (no braces in them).
+        """
+        widget = str(self.tree)
+        lines = "\n".join(
+            f'lappend __ids [{widget} insert {{{parent_id}}} end -text {{{text}}} -tags {tag}]'
+            for text in texts
+        )
+        if not lines:
+            return []
+        script = f'set __ids {{}}\n{lines}\nset __ids'
+        return self.tree.tk.eval(script).split()
+
+    def _add_command_node(self, parent_id: str, serial: str, command: str) -> None:
         """Add a command node to the tree"""
-        self.tree.insert(parent_id, "end", 
+        cmd_id = self.tree.insert(parent_id, "end",
                         text=command,
-                        tags=("command",))  # Apply command styling
+                        tags=_COMMAND_TAG)  # Apply command styling
+        self._node_info[cmd_id] = NodeInfo("command", serial, command)
 
 class OutputWindow:
-    """View layer - handles output display windows"""
-    def __init__(self, parent: tk.Tk, title: str, content: str):
+    """View layer - handles output display windows
+
+    Windows are built once and recycled: closing withdraws the Toplevel
+    instead of destroying it, so repeat opens skip all widget creation.
+    """
+    def __init__(self, parent: tk.Tk, on_close: Optional[callable] = None):
         self.window = tk.Toplevel(parent)
-        self.window.title(title)
-        
+        self._on_close = on_close
+
         # Make window modal
         self.window.transient(parent)
-        self.window.grab_set()
-        
+
         # Set minimum size
         self.window.minsize(400, 300)
-        
-        self._setup_window(content)
 
-    def _setup_window(self, content: str) -> None:
+        self._setup_window()
+
+    def _setup_window(self) -> None:
         """Set up the output window with text and scrollbar"""
         # Create frame for better layout
         frame = ttk.Frame(self.window)
         frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Create text widget with better styling
-        text = tk.Text(frame, wrap=tk.WORD, font=('TkDefaultFont', 10))
-        text.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        
+
+        # Create text widget with better styling; the widget is read-only
+        # so disable the undo stack - with undo enabled Tk keeps a second
+        # copy of large command outputs
+        self.text = tk.Text(frame, wrap=tk.WORD, font=('TkDefaultFont', 10),
+                            undo=False, autoseparators=False, maxundo=0)
+        self.text.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
+
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=text.yview)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.text.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        text.configure(yscrollcommand=scrollbar.set)
-        
-        # Insert content
-        text.insert("1.0", content)
-        text.configure(state="disabled")
-        
+        self.text.configure(yscrollcommand=scrollbar.set)
+
         # Add close button
-        close_button = ttk.Button(self.window, text="Close", command=self.window.destroy)
+        close_button = ttk.Button(self.window, text="Close", command=self.close)
         close_button.pack(pady=5)
-        
-        # Bind Escape key to close
-        self.window.bind('<Escape>', lambda e: self.window.destroy())
+
+        # Bind Escape key and the window manager close button
+        self.window.bind('<Escape>', lambda e: self.close())
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+    def set_content(self, title: str, content: str) -> None:
+        """Fill the recycled window with new content and show it"""
+        self.window.title(title)
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", content)
+        self.text.configure(state="disabled")
+        self.window.deiconify()
+        self.window.grab_set()
+
+    def close(self) -> None:
+        """Hide the window and hand it back for reuse"""
+        self.window.grab_release()
+        self.window.withdraw()
+        if self._on_close:
+            self._on_close(self)
 
 class DeviceViewer(tk.Tk):
     """Main application window"""
+
+    # Number of device nodes inserted per page of the top-level list
+    PAGE_SIZE = 500
+
+    # Idle window for coalescing bursts of tree events
+    DEBOUNCE_MS = 20
+
     def __init__(self, json_path: Optional[str] = None):
         super().__init__()
         self.title("Device Viewer")
@@ -271,6 +556,16 @@ class DeviceViewer(tk.Tk):
         
         self.builder = DeviceTreeBuilder(self.tree, self.model)
 
+        # Paging state for the top-level device list
+        self._pending_serials: List[str] = []
+        self._more_item: Optional[str] = None
+
+        # Pending after() ids per debounced handler
+        self._pending_after: Dict[str, str] = {}
+
+        # Recycled output windows waiting for reuse
+        self._output_pool: List[OutputWindow] = []
+
         # Add Expand button
         style = ttk.Style()
         style.configure("Action.TButton", padding=5)
@@ -304,16 +599,34 @@ class DeviceViewer(tk.Tk):
         
         logger.debug("All event bindings set up")
 
+    def _debounce(self, key: str, func: callable, *args) -> None:
+        """Coalesce bursts of the same event into one run per idle window
+
+        Rapid keyboard/mouse traversal fires the selection and open events
+        many times in quick succession; only the first in each DEBOUNCE_MS
+        window schedules actual work.
+        """
+        if key in self._pending_after:
+            return
+
+        def run():
+            self._pending_after.pop(key, None)
+            func(*args)
+
+        self._pending_after[key] = self.after(self.DEBOUNCE_MS, run)
+
     def _on_selection_changed(self, event: tk.Event) -> None:
+        """Handle tree selection changes (debounced)"""
+        self._debounce("select", self._do_selection_changed, event)
+
+    def _do_selection_changed(self, event: tk.Event) -> None:
         """Handle tree selection changes"""
         selection = self.tree.selection()
         if selection:
-            item_id = selection[0]
-            item = self.tree.item(item_id)
-            parent_id = self.tree.parent(item_id)
-            
+            info = self.builder.node_info(selection[0])
+
             # Only enable expand button for items with potential content
-            if parent_id and item["text"] not in ["interface transceiver", "interfaces fabric transceiver"]:
+            if info and info.kind in ("command", "interface"):
                 self.expand_button.configure(state="normal")
             else:
                 self.expand_button.configure(state="disabled")
@@ -328,76 +641,70 @@ class DeviceViewer(tk.Tk):
             
         item_id = selection[0]
         try:
-            logger.debug(f"Expand button clicked for item: {item_id}")
+            logger.debug("Expand button clicked for item: %s", item_id)
             self._handle_item_open(item_id)
         except Exception as e:
             logger.error(f"Error handling expand: {e}")
             self._show_error("Error", f"Could not expand item: {e}")
 
     def _on_single_click(self, event: tk.Event) -> None:
+        """Handle single click for selection (debounced)"""
+        self._debounce("click", self._do_single_click, event)
+
+    def _do_single_click(self, event: tk.Event) -> None:
         """Handle single click for selection"""
         try:
             item_id = self.tree.identify_row(event.y)
-            logger.debug(f"Single click on item: {item_id}")
-            
+            logger.debug("Single click on item: %s", item_id)
+
             if item_id:
                 # Clear previous selection and select new item
                 self.tree.selection_set(item_id)
-                
-                # Get item info for logging
-                item_text = self.tree.item(item_id)["text"]
-                logger.debug(f"Selected item: {item_text}")
+
+                # Clicking the sentinel row appends the next page
+                if item_id == self._more_item:
+                    self._load_next_page()
+                    return
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Get item info for logging from the cached metadata
+                    logger.debug("Selected item: %s", self.builder.node_info(item_id))
         except Exception as e:
             logger.error(f"Error in single click handler: {e}")
 
     def _on_node_open(self, event: tk.Event) -> None:
+        """Handle node expansion (debounced)"""
+        self._debounce("open", self._do_node_open, event)
+
+    def _do_node_open(self, event: tk.Event) -> None:
         """Handle node expansion"""
         try:
             selection = self.tree.selection()
             if selection:
                 node_id = selection[0]
-                # Only expand if this is a device node
-                if not self.tree.parent(node_id):
+                # Dispatch on the node kind recorded at insert time
+                info = self.builder.node_info(node_id)
+                if not info:
+                    return
+                if info.kind == "device":
                     self.builder.expand_device_node(node_id)
+                elif info.kind in ("iface_cat", "fab_cat"):
+                    self.builder.expand_category_node(node_id)
         except Exception as e:
             logger.error(f"Error expanding node: {e}")
             self._show_error("Error expanding node", str(e))
 
     def _get_command_output(self, device_serial: str, command_text: str) -> Optional[str]:
         """Get the output for a specific command from the loaded data"""
-        logger.debug(f"Getting command output for {device_serial}: {command_text}")
-        
-        device = self.model.get_device(device_serial)
-        if not device:
-            logger.debug(f"Device {device_serial} not found")
-            return None
-        
-        if device.status != "success":
-            logger.debug(f"Device {device_serial} status is not success: {device.status}")
-            return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Getting command output for {device_serial}: {command_text}")
+        return self.model.resolve(device_serial, command_text)
 
-        output = None
-        if command_text == "show system":
-            output = device.system_output
-        elif command_text == "show system backplane":
-            output = device.backplane_output
-        elif command_text == "show system hardware power":
-            output = device.power_output
-        elif command_text == "interface transceiver":
-            logger.debug("Parent node selected, no output")
-            return None
-        elif command_text == "interfaces fabric transceiver":
-            logger.debug("Parent node selected, no output")
-            return None
-        else:
-            # Check if it's an interface
-            if command_text in device.interfaces:
-                output = device.interfaces[command_text]
-            elif command_text in device.fabric_interfaces:
-                output = device.fabric_interfaces[command_text]
-
-        logger.debug(f"Output found: {'Yes' if output else 'No'}")
-        return output
+    def _pop_output_window(self) -> OutputWindow:
+        """Take a recycled output window from the pool, or build one"""
+        if self._output_pool:
+            return self._output_pool.pop()
+        return OutputWindow(self, on_close=self._output_pool.append)
 
     def _show_error(self, title: str, message: str) -> None:
         """Show an error dialog"""
@@ -422,49 +729,64 @@ class DeviceViewer(tk.Tk):
                     logger.debug("Building initial tree")
                     self._build_initial_tree()
 
-            # Start loading data
-            self.model.load_data(json_path, on_load_complete)
+            # Start loading data; the callback runs on the model's worker
+            # thread, so marshal it back to the Tk main loop with after() -
+            # Tk widgets must never be touched from another thread
+            self.model.load_data(
+                json_path,
+                lambda error: self.after(0, on_load_complete, error)
+            )
         except Exception as e:
             logger.error(f"Error starting data load: {e}")
             self._show_error("Error", str(e))
 
     def _build_initial_tree(self) -> None:
-        """Build the initial tree with device nodes"""
+        """Build the initial tree with the first page of device nodes"""
         try:
-            for serial in self.model.get_all_serials():
-                self.builder.build_device_node(serial)
+            self._pending_serials = list(self.model.get_all_serials())
+            self._load_next_page()
         except Exception as e:
             logger.error(f"Error building tree: {e}")
             self._show_error("Error", str(e))
 
+    def _load_next_page(self) -> None:
+        """Insert the next page of device nodes plus a 'Load more' sentinel"""
+        if self._more_item:
+            self.tree.delete(self._more_item)
+            self._more_item = None
+
+        page = self._pending_serials[:self.PAGE_SIZE]
+        del self._pending_serials[:self.PAGE_SIZE]
+
+        with self.builder.batch_update():
+            for serial in page:
+                self.builder.build_device_node(serial)
+
+        if self._pending_serials:
+            self._more_item = self.tree.insert(
+                "", "end",
+                text=f"Load {len(self._pending_serials)} more…",
+                tags=("more",)
+            )
+
     def _handle_item_open(self, item_id: str) -> None:
         """Handle opening an item (shared between button and other triggers)"""
         try:
-            logger.debug(f"Handling open for item: {item_id}")
-            # Get item details
-            item_text = self.tree.item(item_id)["text"]
-            parent_id = self.tree.parent(item_id)
-            logger.debug(f"Item text: {item_text}, Parent: {parent_id}")
-            if not parent_id:
-                logger.debug("No parent found - ignoring")
-                return
-            # Get device ID (might be parent or grandparent)
-            device_id = parent_id
-            if self.tree.parent(parent_id):
-                device_id = self.tree.parent(parent_id)
-                logger.debug(f"Using grandparent as device_id: {device_id}")
-            device_serial = self.tree.item(device_id)["text"]
-            logger.debug(f"Found device serial: {device_serial}")
-            # Skip if this is a category node
-            if item_text in ["interface transceiver", "interfaces fabric transceiver"]:
-                logger.debug("Category node - ignoring")
+            logger.debug("Handling open for item: %s", item_id)
+            # All item details come from the metadata cached at insert time -
+            # no tree.item()/tree.parent() round-trips needed
+            info = self.builder.node_info(item_id)
+            if not info or info.kind not in ("command", "interface"):
+                logger.debug("Not an openable node - ignoring")
                 return
+            device_serial = info.serial
             # Get content
-            content = self._get_command_output(device_serial, item_text)
+            content = self._get_command_output(device_serial, info.command)
             if content:
-                logger.debug(f"Opening window with content (length: {len(content)})")
+                logger.debug("Opening window with content (length: %d)", len(content))
                 try:
-                    window = OutputWindow(self, f"{device_serial} - {item_text}", content)
+                    window = self._pop_output_window()
+                    window.set_content(f"{device_serial} - {info.command}", content)
                     window.window.focus_force()
                     x = self.winfo_x() + 50
                     y = self.winfo_y() + 50
@@ -486,11 +808,10 @@ def build_tree(json_path: str) -> ttk.Treeview:
     tree = ttk.Treeview(root)
     builder = DeviceTreeBuilder(tree, model)
     
-    # Load data synchronously for testing
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-        for device in data:
-            model._devices[device['serial']] = DeviceData.from_dict(device)
+    # Load data synchronously for testing - only the columns the tree
+    # needs, parsed straight from the raw bytes like the async path
+    with open(json_path, 'rb') as f:
+        model.load_from_list_minimal(orjson.loads(f.read()))
     
     # Build tree
     for serial in model.get_all_serials():
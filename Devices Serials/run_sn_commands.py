@@ -2,8 +2,12 @@
 import json
 import re
 from Class_SSH_Con import SSH_Conn
+from concurrent.futures import ThreadPoolExecutor
 import os
 
+# Compiled once - splitting transceiver output runs per device per command
+_IFACE_SPLIT_RE = re.compile(r'(?=Interface\s)')
+
 # List of device serial numbers to process
 SERIALS = [
     "WNG1C7VS00017P2",
@@ -14,7 +18,7 @@ SERIALS = [
 def parse_transceiver_output(output):
     """Parse transceiver output into interface blocks"""
     # Split into blocks starting with "Interface "
-    blocks = re.split(r'(?=Interface\s)', output)
+    blocks = _IFACE_SPLIT_RE.split(output)
     interface_blocks = {}
     
     for block in blocks:
@@ -85,13 +89,14 @@ def collect_device_data(serial):
             pass
 
 def main():
-    # Collect data from all devices
-    all_devices_data = []
-    for serial in SERIALS:
-        print(f"Collecting data from {serial}...")
-        device_data = collect_device_data(serial)
-        all_devices_data.append(device_data)
-        print(f"Done with {serial}")
+    # Collect data from all devices in parallel - each device mostly
+    # waits on SSH, so overlapping the sessions cuts wall-clock time
+    # near-linearly. map() keeps results in SERIALS order.
+    print(f"Collecting data from {len(SERIALS)} devices...")
+    with ThreadPoolExecutor(max_workers=min(16, len(SERIALS))) as executor:
+        all_devices_data = list(executor.map(collect_device_data, SERIALS))
+    for device_data in all_devices_data:
+        print(f"Done with {device_data['serial']}")
     
     # Save all data to a single JSON file
     with open("devices_data.json", "w") as f:
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 from Class_SSH_Con import SSH_Conn
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 import os
 
@@ -10,6 +11,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Commands to execute
+COMMANDS = [
+    "system netconf vrf mgmt0 admin-state enabled client-list 0.0.0.0/0",
+    "system netconf vrf mgmt0 client-list type allow",
+    "system ssh server vrf mgmt0 admin-state enabled client-list 0.0.0.0/0"
+]
+
+def _configure_one(serial):
+    """Configure a single device and return (serial, output_or_error)
+
+    Each worker builds its own SSH_Conn - connections are never shared
+    across threads.
+    """
+    dev_logger = logger.getChild(serial)
+    ssh = None
+    try:
+        # Create a unique log file for each device's SSH session
+        # This will create files like: WNG1C7VS00017P2_ssh_log, WDY1CBV400005_ssh_log, etc.
+        log_file = os.path.join(os.getcwd(), f'{serial}_ssh_lo_ALPHA')
+        dev_logger.info(f"Creating session log file: {log_file}")
+
+        # Connect to device with session logging enabled
+        dev_logger.info(f"Connecting to {serial}")
+        ssh = SSH_Conn(
+            host=serial,
+            icmp_test=False,
+            session_log=log_file  # This enables detailed SSH session logging
+        )
+        ssh.connect()
+
+        # Enter config mode and execute commands
+        ssh.change_mode(ssh.SSH_ENUMS.CLI_MODE.DNOS_CFG)
+        for cmd in COMMANDS:
+            ssh.exec_command(cmd)
+
+        # Commit and show results
+        ssh.commit_cfg(commit_name="netconf_ssh_config")
+        ssh.change_mode(ssh.SSH_ENUMS.CLI_MODE.DNOS_SHOW)
+
+        # Show netconf configuration
+        return serial, ssh.exec_command("show system netconf")
+
+    except Exception as e:
+        dev_logger.error(f"Error with {serial}: {str(e)}")
+        return serial, e
+
+    finally:
+        try:
+            if ssh:
+                ssh.disconnect()
+        except:
+            pass
+
 def configure_devices():
     # List of device serial numbers to configure
     devices = [
@@ -18,53 +72,20 @@ def configure_devices():
         "WK31BC7B00001B2"
     ]
 
-    # Commands to execute
-    commands = [
-        "system netconf vrf mgmt0 admin-state enabled client-list 0.0.0.0/0",
-        "system netconf vrf mgmt0 client-list type allow",
-        "system ssh server vrf mgmt0 admin-state enabled client-list 0.0.0.0/0"
-    ]
+    # SSH sessions are I/O bound, so fan the devices out over a thread
+    # pool instead of configuring them one at a time
+    with ThreadPoolExecutor(max_workers=min(16, len(devices))) as executor:
+        futures = {executor.submit(_configure_one, serial): serial
+                   for serial in devices}
 
-    # Process each device
-    for serial in devices:
-        try:
-            # Create a unique log file for each device's SSH session
-            # This will create files like: WNG1C7VS00017P2_ssh_log, WDY1CBV400005_ssh_log, etc.
-            log_file = os.path.join(os.getcwd(), f'{serial}_ssh_lo_ALPHA')
-            logger.info(f"Creating session log file: {log_file}")
-            
-            # Connect to device with session logging enabled
-            logger.info(f"Connecting to {serial}")
-            ssh = SSH_Conn(
-                host=serial,
-                icmp_test=False,
-                session_log=log_file  # This enables detailed SSH session logging
-            )
-            ssh.connect()
-            
-            # Enter config mode and execute commands
-            ssh.change_mode(ssh.SSH_ENUMS.CLI_MODE.DNOS_CFG)
-            for cmd in commands:
-                ssh.exec_command(cmd)
-            
-            # Commit and show results
-            ssh.commit_cfg(commit_name="netconf_ssh_config")
-            ssh.change_mode(ssh.SSH_ENUMS.CLI_MODE.DNOS_SHOW)
-            
-            # Show netconf configuration
+        for future in as_completed(futures):
+            serial, result = future.result()
+            if isinstance(result, Exception):
+                continue
             print(f"\nNetconf configuration for {serial}:")
             print("=" * 50)
-            print(ssh.exec_command("show system netconf"))
+            print(result)
             print("=" * 50)
-            
-        except Exception as e:
-            logger.error(f"Error with {serial}: {str(e)}")
-            
-        finally:
-            try:
-                ssh.disconnect()
-            except:
-                pass
 
 if __name__ == "__main__":
-    configure_devices() 
\ No newline at end of file
+    configure_devices()
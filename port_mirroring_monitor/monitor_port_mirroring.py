@@ -11,11 +11,12 @@ This application monitors port mirroring sessions on a network device by:
 """
 
 import re
-import json
 import time
+import hashlib
+import orjson
 import threading
 from datetime import datetime
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, jsonify, Response
 from Class_SSH_Con import SSH_Conn
 import argparse
 import sys
@@ -23,6 +24,51 @@ import logging
 
 app = Flask(__name__)
 
+# Compiled once at import - these run on every counter line of every poll
+_RX_RE = re.compile(r'RX octets:\s+(\d+)\s+\([^/]*\/\s*([\d.]+)\s*Mbps\)')
+_TX_RE = re.compile(r'TX octets:\s+(\d+)\s+\([^/]*\/\s*([\d.]+)\s*Mbps\)')
+
+# Whole counter block (header + RX + TX lines) captured in one pass, so the
+# combined-output parse is a single C-level scan instead of a Python line loop
+_BLOCK_RE = re.compile(
+    r'^(\S+)[^\n]*\n'
+    r'\s*RX octets:\s+(\d+)\s+\([^/]*\/\s*([\d.]+)\s*Mbps\)[^\n]*\n'
+    r'\s*TX octets:\s+(\d+)\s+\([^/]*\/\s*([\d.]+)\s*Mbps\)',
+    re.MULTILINE)
+
+# One compiled pattern per flattened-config construct; each scans the whole
+# output once in C instead of per-line Python split/index work
+_ADM_RE = re.compile(r'^services port-mirroring session (\S+).*admin-state enabled', re.MULTILINE)
+_DST_RE = re.compile(r'^services port-mirroring session (\S+) destination-interface (\S+)', re.MULTILINE)
+_SRC_RE = re.compile(r'^services port-mirroring session (\S+) source-interface (\S+)'
+                     r'(?:.*?\bdirection\s+(ingress|egress|both)\b)?', re.MULTILINE)
+_DESC_RE = re.compile(r'^services port-mirroring session (\S+).*\bdescription\s+(.+)$', re.MULTILINE)
+
+# Display template per mirror direction, chosen once at parse time. Only
+# 'both' needs per-cycle numbers filled in; the rest are fixed literals.
+_DIRECTION_FMT = {
+    'both': 'RX+TX (both: %.2f+%.2f)',
+    'ingress': 'RX (ingress only)',
+    'egress': 'TX (egress only)'
+}
+
+def _new_session(name):
+    """Blank session record - shared by every parse branch"""
+    return {
+        'name': name,
+        'admin_state': 'unknown',
+        'source_interfaces': [],
+        'destination_interface': None,
+        'description': None
+    }
+
+def _session_for(sessions, name):
+    """Fetch-or-create the session record in a single dict probe"""
+    session = sessions.get(name)
+    if session is None:
+        session = sessions[name] = _new_session(name)
+    return session
+
 # Global variables for monitoring
 monitoring_data = {
     'sessions': {},
@@ -31,6 +77,20 @@ monitoring_data = {
     'error': None
 }
 
+# State lock plus pre-serialized /api/data payload. Every update goes
+# through _publish, which applies the new fields and re-serializes under
+# the lock, so request threads never see a half-updated cycle and just
+# hand out cached bytes instead of re-serializing per client.
+_state_lock = threading.RLock()
+_payload_bytes = orjson.dumps(monitoring_data)
+
+def _publish(**fields):
+    """Atomically apply fields to monitoring_data and refresh the snapshot"""
+    global _payload_bytes
+    with _state_lock:
+        monitoring_data.update(fields)
+        _payload_bytes = orjson.dumps(monitoring_data, default=str)
+
 class PortMirroringMonitor:
     def __init__(self, host, username='dnroot', password='dnroot'):
         self.host = host
@@ -38,6 +98,19 @@ class PortMirroringMonitor:
         self.password = password
         self.ssh_conn = None
         self.monitoring = False
+        # Parsed config cache: (raw output digest, sessions dict). The
+        # config rarely changes, so skip the SSH fetch inside the TTL and
+        # skip re-parsing when the raw output is unchanged.
+        self._config_cache = None
+        self._config_fetched_at = 0.0
+        self._config_ttl = 60
+        # Counters fetched for the current poll cycle, keyed by interface.
+        # An interface shared by several sessions (or used as both source
+        # and destination) is only ever fetched once per cycle.
+        self._cycle_counters = {}
+        # Whether the NOS supports '| display json' for counters:
+        # None = not probed yet, then True/False after the first cycle
+        self._structured_counters = None
         
     def connect(self):
         """Establish SSH connection to the device"""
@@ -58,6 +131,12 @@ class PortMirroringMonitor:
             self.ssh_conn.connect()
             
             if self.ssh_conn.get_status():
+                # Keep the TCP/SSH session alive between polls so a quiet
+                # device doesn't cost a fresh handshake + auth next cycle
+                try:
+                    self.ssh_conn._net_connect.remote_conn.transport.set_keepalive(30)
+                except Exception:
+                    pass
                 print(f"Successfully connected to {self.host}")
                 return True
             else:
@@ -77,113 +156,90 @@ class PortMirroringMonitor:
             except Exception as e:
                 print(f"Disconnect error: {str(e)}")
     
+    def invalidate_config_cache(self):
+        """Force the next poll to re-fetch and re-parse the config"""
+        self._config_cache = None
+        self._config_fetched_at = 0.0
+
     def get_port_mirroring_config(self):
         """Retrieve port mirroring configuration from the device"""
         try:
+            # Serve from cache while the TTL holds
+            now = time.monotonic()
+            if self._config_cache and now - self._config_fetched_at < self._config_ttl:
+                return self._config_cache[1]
+
             if not self.ssh_conn or not self.ssh_conn.get_status():
                 raise Exception("SSH connection not established")
-            
+
             # Execute command to get port mirroring configuration
             cmd = "sh conf services port-mirroring | flatten"
             output = self.ssh_conn.exec_command(cmd, timeout=30)
-            
+
             if not output:
                 raise Exception("No output received from port mirroring command")
-            
-            return self.parse_port_mirroring_config(output)
-            
+
+            # Only re-parse when the raw output actually changed
+            digest = hashlib.md5(output.encode()).digest()
+            if self._config_cache and digest == self._config_cache[0]:
+                sessions = self._config_cache[1]
+            else:
+                sessions = self.parse_port_mirroring_config(output)
+
+            self._config_cache = (digest, sessions)
+            self._config_fetched_at = now
+            return sessions
+
         except Exception as e:
             raise Exception(f"Failed to get port mirroring config: {str(e)}")
     
     def parse_port_mirroring_config(self, config_output):
-        """Parse port mirroring configuration to extract sessions"""
+        """Parse port mirroring configuration to extract sessions
+
+        Each construct is pulled out with one compiled-regex pass over the
+        whole flattened output instead of per-line split()/index() scans.
+        """
         sessions = {}
-        
-        # Split output into lines
-        lines = config_output.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Look for session definitions
-            if 'services port-mirroring session' in line:
-                parts = line.split()
-                
-                if len(parts) >= 4:  # Ensure we have enough parts
-                    session_name = parts[3]
-                    
-                    if 'admin-state enabled' in line:
-                        # Extract session name
-                        if session_name not in sessions:
-                            sessions[session_name] = {
-                                'name': session_name,
-                                'admin_state': 'enabled',
-                                'source_interfaces': [],
-                                'destination_interface': None,
-                                'description': None
-                            }
-                    
-                    elif 'destination-interface' in line and len(parts) >= 6:
-                        # Extract destination interface - it's parts[5] not parts[4]
-                        dest_interface = parts[5]
-                        if session_name not in sessions:
-                            sessions[session_name] = {
-                                'name': session_name,
-                                'admin_state': 'unknown',
-                                'source_interfaces': [],
-                                'destination_interface': None,
-                                'description': None
-                            }
-                        sessions[session_name]['destination_interface'] = dest_interface
-                    
-                    elif 'source-interface' in line and len(parts) >= 6:
-                        # Extract source interface - it's parts[5] not parts[4]
-                        source_interface = parts[5]
-                        
-                        # Parse direction - look for 'direction' keyword and get the next part
-                        direction = 'both'  # default
-                        if 'direction' in parts:
-                            dir_index = parts.index('direction')
-                            if dir_index + 1 < len(parts):
-                                next_part = parts[dir_index + 1]
-                                # Handle valid direction values, default to 'both' for invalid ones
-                                if next_part in ['ingress', 'egress', 'both']:
-                                    direction = next_part
-                                else:
-                                    direction = 'both'  # Default for invalid/truncated values
-                        
-                        if session_name not in sessions:
-                            sessions[session_name] = {
-                                'name': session_name,
-                                'admin_state': 'unknown',
-                                'source_interfaces': [],
-                                'destination_interface': None,
-                                'description': None
-                            }
-                        sessions[session_name]['source_interfaces'].append({
-                            'interface': source_interface,
-                            'direction': direction
-                        })
-                    
-                    elif 'description' in line and len(parts) >= 6:
-                        # Extract description - everything after 'description'
-                        desc_index = parts.index('description')
-                        if desc_index + 1 < len(parts):
-                            description = ' '.join(parts[desc_index + 1:])
-                            if session_name not in sessions:
-                                sessions[session_name] = {
-                                    'name': session_name,
-                                    'admin_state': 'unknown',
-                                    'source_interfaces': [],
-                                    'destination_interface': None,
-                                    'description': None
-                                }
-                            sessions[session_name]['description'] = description
-        
+
+        for match in _ADM_RE.finditer(config_output):
+            session_name = match.group(1)
+            session = _session_for(sessions, session_name)
+            session['admin_state'] = 'enabled'
+
+        for match in _DST_RE.finditer(config_output):
+            session_name = match.group(1)
+            session = _session_for(sessions, session_name)
+            session['destination_interface'] = match.group(2)
+
+        for match in _SRC_RE.finditer(config_output):
+            session = _session_for(sessions, match.group(1))
+            # The pattern only matches valid direction keywords, so a
+            # missing/invalid value falls through to 'both' here
+            direction = match.group(3) or 'both'
+            session['source_interfaces'].append({
+                'interface': match.group(2),
+                'direction': direction,
+                'fmt': _DIRECTION_FMT[direction]
+            })
+
+        for match in _DESC_RE.finditer(config_output):
+            session_name = match.group(1)
+            session = _session_for(sessions, session_name)
+            session['description'] = match.group(2).strip()
+
         return sessions
     
     def get_interface_counters(self, interface):
-        """Get traffic counters for a specific interface"""
+        """Get traffic counters for a specific interface
+
+        Served from the per-cycle cache when the monitoring loop has
+        already fetched this interface, so late lookups (validation or
+        future per-session logic) never trigger a second SSH round trip
+        within the same poll.
+        """
+        cached = self._cycle_counters.get(interface)
+        if cached is not None:
+            return cached
         try:
             if not self.ssh_conn or not self.ssh_conn.get_status():
                 raise Exception("SSH connection not established")
@@ -201,6 +257,91 @@ class PortMirroringMonitor:
             print(f"Failed to get counters for {interface}: {str(e)}")
             return {'rx_mbps': 0.0, 'tx_mbps': 0.0, 'rx_octets': 0, 'tx_octets': 0}
     
+    def _counters_from_json(self, output, counters):
+        """Fill counters from '| display json' output
+
+        Walks the structured payload for per-interface records carrying
+        octet counters. Returns True if at least one monitored interface
+        was filled, False when the output isn't usable (older NOS).
+        """
+        try:
+            data = orjson.loads(output)
+        except (orjson.JSONDecodeError, TypeError):
+            return False
+
+        filled = False
+
+        def walk(node):
+            nonlocal filled
+            if isinstance(node, dict):
+                name = node.get('name') or node.get('interface-name')
+                if name in counters and ('rx-octets' in node or 'tx-octets' in node):
+                    entry = counters[name]
+                    entry['rx_octets'] = int(node.get('rx-octets', 0))
+                    entry['tx_octets'] = int(node.get('tx-octets', 0))
+                    entry['rx_mbps'] = float(node.get('rx-mbps', 0.0))
+                    entry['tx_mbps'] = float(node.get('tx-mbps', 0.0))
+                    filled = True
+                else:
+                    for value in node.values():
+                        walk(value)
+            elif isinstance(node, list):
+                for value in node:
+                    walk(value)
+
+        walk(data)
+        return filled
+
+    def get_all_interface_counters(self, interfaces):
+        """Get traffic counters for all interfaces with a single command
+
+        One combined 'sh interfaces counters' round trip replaces the
+        per-interface calls, so a poll costs one SSH RTT regardless of
+        how many interfaces the sessions touch. Structured JSON output
+        is preferred when the NOS supports it - orjson parses it straight
+        into the counters dict - with the regex scrape as the fallback.
+        """
+        counters = {interface: {'rx_mbps': 0.0, 'tx_mbps': 0.0,
+                                'rx_octets': 0, 'tx_octets': 0}
+                    for interface in interfaces}
+        try:
+            if not self.ssh_conn or not self.ssh_conn.get_status():
+                raise Exception("SSH connection not established")
+
+            # Prefer structured output; probe once and remember the answer
+            if self._structured_counters is not False:
+                output = self.ssh_conn.exec_command(
+                    'sh interfaces counters | display json', timeout=30)
+                if output and self._counters_from_json(output, counters):
+                    self._structured_counters = True
+                    return counters
+                self._structured_counters = False
+
+            # Keep the interface header lines so each RX/TX pair can be
+            # attributed to its interface block
+            cmd = 'sh interfaces counters | inc regex "(^\\S|RX octets:|TX octets:)"'
+            output = self.ssh_conn.exec_command(cmd, timeout=30)
+
+            if not output:
+                return counters
+
+            # One finditer pass extracts every (iface, rx, tx) block; only
+            # monitored interfaces are filled in, the rest are skipped
+            for match in _BLOCK_RE.finditer(output):
+                entry = counters.get(match.group(1))
+                if entry is None:
+                    continue
+                entry['rx_octets'] = int(match.group(2))
+                entry['rx_mbps'] = float(match.group(3))
+                entry['tx_octets'] = int(match.group(4))
+                entry['tx_mbps'] = float(match.group(5))
+
+            return counters
+
+        except Exception as e:
+            print(f"Failed to get counters: {str(e)}")
+            return counters
+
     def parse_interface_counters(self, counter_output):
         """Parse interface counter output to extract traffic rates"""
         counters = {'rx_mbps': 0.0, 'tx_mbps': 0.0, 'rx_octets': 0, 'tx_octets': 0}
@@ -209,51 +350,50 @@ class PortMirroringMonitor:
         
         for line in lines:
             line = line.strip()
-            
-            if 'RX octets:' in line:
-                # Extract RX Mbps: "RX octets: 12948298 ( 217 bps / 0.0 Mbps)"
-                match = re.search(r'RX octets:\s+(\d+)\s+\([^/]*\/\s*([\d.]+)\s*Mbps\)', line)
-                if match:
-                    counters['rx_octets'] = int(match.group(1))
-                    counters['rx_mbps'] = float(match.group(2))
-            
-            elif 'TX octets:' in line:
-                # Extract TX Mbps: "TX octets: 3259646366958 ( 376 bps / 0.0 Mbps)"
-                match = re.search(r'TX octets:\s+(\d+)\s+\([^/]*\/\s*([\d.]+)\s*Mbps\)', line)
-                if match:
-                    counters['tx_octets'] = int(match.group(1))
-                    counters['tx_mbps'] = float(match.group(2))
-        
+
+            # Extract RX Mbps: "RX octets: 12948298 ( 217 bps / 0.0 Mbps)"
+            match = _RX_RE.search(line)
+            if match:
+                counters['rx_octets'] = int(match.group(1))
+                counters['rx_mbps'] = float(match.group(2))
+                continue
+
+            # Extract TX Mbps: "TX octets: 3259646366958 ( 376 bps / 0.0 Mbps)"
+            match = _TX_RE.search(line)
+            if match:
+                counters['tx_octets'] = int(match.group(1))
+                counters['tx_mbps'] = float(match.group(2))
+
         return counters
     
-    def validate_mirroring_session(self, session_data, source_counters, dest_counters):
+    def validate_mirroring_session(self, session_data, counters):
         """Validate mirroring effectiveness by comparing source and destination traffic"""
         validation_results = []
-        
+
+        # The destination side is constant for the whole session - resolve
+        # it once instead of per source row
+        dest_interface = session_data['destination_interface']
+        dest_traffic = counters[dest_interface]['tx_mbps']
+
         for source_info in session_data['source_interfaces']:
             source_interface = source_info['interface']
             direction = source_info['direction']
-            
-            # Get source traffic based on direction
-            if direction == 'both':
-                # For 'both' direction, mirror captures RX + TX traffic
-                source_traffic = source_counters[source_interface]['rx_mbps'] + source_counters[source_interface]['tx_mbps']
-                source_direction = f'RX+TX (both: {source_counters[source_interface]["rx_mbps"]:.2f}+{source_counters[source_interface]["tx_mbps"]:.2f})'
-            elif direction == 'ingress':
-                source_traffic = source_counters[source_interface]['rx_mbps']
-                source_direction = 'RX (ingress only)'
+            source = counters[source_interface]
+
+            # Get source traffic based on direction; the display template
+            # was chosen at parse time, only 'both' needs numbers filled in
+            fmt = source_info.get('fmt') or _DIRECTION_FMT.get(direction, _DIRECTION_FMT['both'])
+            if direction == 'ingress':
+                source_traffic = source['rx_mbps']
+                source_direction = fmt
             elif direction == 'egress':
-                source_traffic = source_counters[source_interface]['tx_mbps']
-                source_direction = 'TX (egress only)'
+                source_traffic = source['tx_mbps']
+                source_direction = fmt
             else:
-                # Default to both directions for unknown direction types
-                source_traffic = source_counters[source_interface]['rx_mbps'] + source_counters[source_interface]['tx_mbps']
-                source_direction = f'RX+TX (default: {source_counters[source_interface]["rx_mbps"]:.2f}+{source_counters[source_interface]["tx_mbps"]:.2f})'
-            
-            # Get destination traffic (mirrored traffic appears on TX)
-            dest_interface = session_data['destination_interface']
-            dest_traffic = dest_counters[dest_interface]['tx_mbps']
-            
+                # For 'both' direction, mirror captures RX + TX traffic
+                source_traffic = source['rx_mbps'] + source['tx_mbps']
+                source_direction = fmt % (source['rx_mbps'], source['tx_mbps'])
+
             # Validate mirroring effectiveness
             status = "✅"
             message = ""
@@ -300,8 +440,8 @@ class PortMirroringMonitor:
             sessions = self.get_port_mirroring_config()
             
             if not sessions:
-                monitoring_data['error'] = "No port mirroring sessions found"
-                monitoring_data['status'] = "No Sessions"
+                _publish(error="No port mirroring sessions found",
+                         status="No Sessions")
                 return
             
             # Get interface counters for all interfaces
@@ -312,81 +452,105 @@ class PortMirroringMonitor:
                 for source in session['source_interfaces']:
                     all_interfaces.add(source['interface'])
             
-            # Collect counters for all interfaces
-            source_counters = {}
-            dest_counters = {}
-            
-            for interface in all_interfaces:
-                counters = self.get_interface_counters(interface)
-                source_counters[interface] = counters
-                dest_counters[interface] = counters
-            
+            # Collect counters for all interfaces in one round trip and
+            # publish them as this cycle's cache
+            counters = self.get_all_interface_counters(all_interfaces)
+            self._cycle_counters = counters
+
             # Validate each session
             session_results = {}
             for session_name, session_data in sessions.items():
                 if session_data['destination_interface'] and session_data['source_interfaces']:
                     validation_results = self.validate_mirroring_session(
-                        session_data, source_counters, dest_counters
+                        session_data, counters
                     )
-                    
+
                     session_results[session_name] = {
                         'config': session_data,
                         'validation': validation_results,
-                        'source_counters': {src['interface']: source_counters[src['interface']] 
+                        'source_counters': {src['interface']: counters[src['interface']]
                                           for src in session_data['source_interfaces']},
-                        'dest_counters': {session_data['destination_interface']: 
-                                        dest_counters[session_data['destination_interface']]}
+                        'dest_counters': {session_data['destination_interface']:
+                                        counters[session_data['destination_interface']]}
                     }
             
-            # Update global monitoring data
-            monitoring_data['sessions'] = session_results
-            monitoring_data['last_update'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            monitoring_data['status'] = 'Connected'
-            monitoring_data['error'] = None
-            
+            # Publish the whole cycle in one swap; the timestamp is
+            # formatted once per poll - nothing else should call datetime.now()
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            _publish(sessions=session_results,
+                     last_update=now_str,
+                     status='Connected',
+                     error=None)
+
         except Exception as e:
-            monitoring_data['error'] = str(e)
-            monitoring_data['status'] = 'Error'
+            _publish(error=str(e), status='Error')
             print(f"Monitoring error: {str(e)}")
 
 # Global monitor instance
 monitor = None
 
+# Set to stop the background monitoring loop; waiting on it instead of
+# time.sleep keeps the poll interval interruptible at shutdown
+stop_event = threading.Event()
+
 def monitoring_loop(host, interval):
     """Background monitoring loop"""
     global monitor, monitoring_data
-    
+
     monitor = PortMirroringMonitor(host)
-    
-    while True:
+    failures = 0  # consecutive poll failures; gates teardown + backoff
+
+    # Adaptive polling: while the octet counters sit still the interval
+    # doubles up to a cap, and any movement snaps it back to the base
+    # rate - idle links stop costing an SSH round trip every few seconds
+    current_interval = interval
+    last_octets = None
+
+    while not stop_event.is_set():
         try:
             if not monitor.ssh_conn or not monitor.ssh_conn.get_status():
-                monitoring_data['status'] = 'Connecting...'
+                _publish(status='Connecting...')
                 if monitor.connect():
-                    monitoring_data['status'] = 'Connected'
+                    _publish(status='Connected')
                 else:
-                    monitoring_data['status'] = 'Connection Failed'
-                    monitoring_data['error'] = 'Failed to establish SSH connection'
-                    time.sleep(interval)
+                    _publish(status='Connection Failed',
+                             error='Failed to establish SSH connection')
+                    stop_event.wait(interval)
                     continue
-            
+
             # Perform monitoring
             monitor.monitor_sessions()
-            
+            failures = 0
+
+            # Compare this cycle's octet counters with the last cycle's
+            octets = {iface: (c['rx_octets'], c['tx_octets'])
+                      for iface, c in monitor._cycle_counters.items()}
+            if octets and octets == last_octets:
+                # never back off below the configured base interval, even
+                # when it is already above the 60s idle cap
+                current_interval = max(interval, min(current_interval * 2, 60))
+            else:
+                current_interval = interval
+            last_octets = octets
+
         except Exception as e:
-            monitoring_data['error'] = str(e)
-            monitoring_data['status'] = 'Error'
+            _publish(error=str(e), status='Error')
             print(f"Monitoring loop error: {str(e)}")
-            
-            # Try to reconnect
-            try:
-                if monitor.ssh_conn:
-                    monitor.disconnect()
-                time.sleep(2)
-            except:
-                pass
-        
-        time.sleep(interval)
+
+            # A single bad poll is usually a device hiccup - the keepalive
+            # holds the session, so retry on it first and only pay for a
+            # full teardown/handshake after repeated failures, with
+            # exponential backoff between reconnect attempts
+            failures += 1
+            if failures >= 3:
+                try:
+                    if monitor.ssh_conn:
+                        monitor.disconnect()
+                    stop_event.wait(min(2 ** (failures - 2), 30))
+                except:
+                    pass
+
+        stop_event.wait(current_interval)
 
 @app.route('/')
 def index():
@@ -396,351 +560,19 @@ def index():
 @app.route('/api/data')
 def get_data():
     """API endpoint to get current monitoring data"""
-    return jsonify(monitoring_data)
+    with _state_lock:
+        payload = _payload_bytes
+    return Response(payload, mimetype='application/json')
 
 @app.route('/api/status')
 def get_status():
     """API endpoint to get current status"""
-    return jsonify({
-        'status': monitoring_data['status'],
-        'last_update': monitoring_data['last_update'],
-        'error': monitoring_data['error']
-    })
-
-# HTML template content (will be saved separately)
-HTML_TEMPLATE = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Port Mirroring Monitor</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            background-color: white;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            padding: 30px;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid #e0e0e0;
-        }
-        .header h1 {
-            color: #333;
-            margin-bottom: 10px;
-        }
-        .status-bar {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 15px;
-            margin-bottom: 20px;
-            border-radius: 5px;
-            font-weight: bold;
-        }
-        .status-connected { background-color: #d4edda; color: #155724; }
-        .status-error { background-color: #f8d7da; color: #721c24; }
-        .status-connecting { background-color: #fff3cd; color: #856404; }
-        .status-disconnected { background-color: #f8d7da; color: #721c24; }
-        
-        .session-card {
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }
-        .session-header {
-            background-color: #007bff;
-            color: white;
-            padding: 15px;
-            font-weight: bold;
-            font-size: 18px;
-        }
-        .session-content {
-            padding: 20px;
-        }
-        .validation-item {
-            display: flex;
-            align-items: center;
-            padding: 12px;
-            margin-bottom: 10px;
-            border-radius: 5px;
-            border-left: 4px solid #007bff;
-        }
-        .validation-success {
-            background-color: #d4edda;
-            border-left-color: #28a745;
-        }
-        .validation-warning {
-            background-color: #fff3cd;
-            border-left-color: #ffc107;
-        }
-        .validation-error {
-            background-color: #f8d7da;
-            border-left-color: #dc3545;
-        }
-        .status-icon {
-            font-size: 20px;
-            margin-right: 15px;
-        }
-        .interface-info {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin-top: 15px;
-        }
-        .interface-box {
-            border: 1px solid #e0e0e0;
-            border-radius: 5px;
-            padding: 15px;
-            background-color: #f8f9fa;
-        }
-        .interface-title {
-            font-weight: bold;
-            color: #495057;
-            margin-bottom: 10px;
-        }
-        .counter-row {
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 5px;
-        }
-        .counter-label {
-            color: #6c757d;
-        }
-        .counter-value {
-            font-weight: bold;
-            color: #495057;
-        }
-        .traffic-rate {
-            color: #007bff;
-            font-weight: bold;
-        }
-        .no-sessions {
-            text-align: center;
-            color: #6c757d;
-            font-style: italic;
-            padding: 40px;
-        }
-        .loading {
-            text-align: center;
-            padding: 40px;
-        }
-        .error-message {
-            background-color: #f8d7da;
-            color: #721c24;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            border: 1px solid #f5c6cb;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔍 Port Mirroring Monitor</h1>
-            <p>Real-time monitoring of network port mirroring sessions</p>
-        </div>
-        
-        <div id="status-bar" class="status-bar status-connecting">
-            <span id="status-text">Connecting...</span>
-            <span id="last-update">Last Update: Never</span>
-        </div>
-        
-        <div id="error-container"></div>
-        
-        <div id="content">
-            <div class="loading">
-                <p>🔄 Loading port mirroring data...</p>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        function updateDisplay() {
-            fetch('/api/data')
-                .then(response => response.json())
-                .then(data => {
-                    updateStatusBar(data);
-                    updateContent(data);
-                })
-                .catch(error => {
-                    console.error('Error fetching data:', error);
-                    updateStatusBar({ status: 'Error', error: 'Failed to fetch data' });
-                });
-        }
-
-        function updateStatusBar(data) {
-            const statusBar = document.getElementById('status-bar');
-            const statusText = document.getElementById('status-text');
-            const lastUpdate = document.getElementById('last-update');
-            
-            // Update status
-            statusText.textContent = `Status: ${data.status}`;
-            lastUpdate.textContent = `Last Update: ${data.last_update || 'Never'}`;
-            
-            // Update status bar class
-            statusBar.className = 'status-bar';
-            switch(data.status) {
-                case 'Connected':
-                    statusBar.classList.add('status-connected');
-                    break;
-                case 'Error':
-                case 'Connection Failed':
-                    statusBar.classList.add('status-error');
-                    break;
-                case 'Connecting...':
-                    statusBar.classList.add('status-connecting');
-                    break;
-                default:
-                    statusBar.classList.add('status-disconnected');
-            }
-        }
-
-        function updateContent(data) {
-            const content = document.getElementById('content');
-            const errorContainer = document.getElementById('error-container');
-            
-            // Clear previous error
-            errorContainer.innerHTML = '';
-            
-            // Show error if present
-            if (data.error) {
-                errorContainer.innerHTML = `
-                    <div class="error-message">
-                        <strong>Error:</strong> ${data.error}
-                    </div>
-                `;
-            }
-            
-            // Update main content
-            if (!data.sessions || Object.keys(data.sessions).length === 0) {
-                content.innerHTML = '<div class="no-sessions">No port mirroring sessions found</div>';
-                return;
-            }
-            
-            let html = '';
-            for (const [sessionName, sessionData] of Object.entries(data.sessions)) {
-                html += generateSessionCard(sessionName, sessionData);
-            }
-            content.innerHTML = html;
-        }
-
-        function generateSessionCard(sessionName, sessionData) {
-            const config = sessionData.config;
-            const validations = sessionData.validation;
-            const sourceCounters = sessionData.source_counters;
-            const destCounters = sessionData.dest_counters;
-            
-            let validationHtml = '';
-            for (const validation of validations) {
-                const statusClass = validation.status === '✅' ? 'validation-success' : 
-                                  validation.status === '⚠️' ? 'validation-warning' : 'validation-error';
-                
-                validationHtml += `
-                    <div class="validation-item ${statusClass}">
-                        <span class="status-icon">${validation.status}</span>
-                        <div>
-                            <strong>${validation.source_interface} → ${validation.dest_interface}</strong><br>
-                            Source ${validation.source_direction}: ${validation.source_traffic.toFixed(2)} Mbps | 
-                            Dest TX: ${validation.dest_traffic.toFixed(2)} Mbps<br>
-                            <em>${validation.message}</em>
-                        </div>
-                    </div>
-                `;
-            }
-            
-            // Generate interface counters HTML
-            let interfaceHtml = '<div class="interface-info">';
-            
-            // Source interfaces
-            for (const [interface, counters] of Object.entries(sourceCounters)) {
-                interfaceHtml += `
-                    <div class="interface-box">
-                        <div class="interface-title">📥 Source: ${interface}</div>
-                        <div class="counter-row">
-                            <span class="counter-label">RX:</span>
-                            <span class="counter-value">${counters.rx_octets.toLocaleString()} octets</span>
-                        </div>
-                        <div class="counter-row">
-                            <span class="counter-label">TX:</span>
-                            <span class="counter-value">${counters.tx_octets.toLocaleString()} octets</span>
-                        </div>
-                        <div class="counter-row">
-                            <span class="counter-label">Rate:</span>
-                            <span class="traffic-rate">RX: ${counters.rx_mbps} Mbps | TX: ${counters.tx_mbps} Mbps</span>
-                        </div>
-                    </div>
-                `;
-            }
-            
-            // Destination interface
-            for (const [interface, counters] of Object.entries(destCounters)) {
-                interfaceHtml += `
-                    <div class="interface-box">
-                        <div class="interface-title">📤 Destination: ${interface}</div>
-                        <div class="counter-row">
-                            <span class="counter-label">RX:</span>
-                            <span class="counter-value">${counters.rx_octets.toLocaleString()} octets</span>
-                        </div>
-                        <div class="counter-row">
-                            <span class="counter-label">TX:</span>
-                            <span class="counter-value">${counters.tx_octets.toLocaleString()} octets</span>
-                        </div>
-                        <div class="counter-row">
-                            <span class="counter-label">Rate:</span>
-                            <span class="traffic-rate">RX: ${counters.rx_mbps} Mbps | TX: ${counters.tx_mbps} Mbps</span>
-                        </div>
-                    </div>
-                `;
-            }
-            
-            interfaceHtml += '</div>';
-            
-            return `
-                <div class="session-card">
-                    <div class="session-header">
-                        Session: ${sessionName}
-                        ${config.description ? ` - ${config.description}` : ''}
-                    </div>
-                    <div class="session-content">
-                        ${validationHtml}
-                        ${interfaceHtml}
-                    </div>
-                </div>
-            `;
-        }
-
-        // Initial load and set up auto-refresh
-        updateDisplay();
-        setInterval(updateDisplay, 5000); // Refresh every 5 seconds
-    </script>
-</body>
-</html>'''
-
-def create_template_file():
-    """Create the HTML template file"""
-    import os
-    templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
-    os.makedirs(templates_dir, exist_ok=True)
-    
-    template_path = os.path.join(templates_dir, 'index.html')
-    with open(template_path, 'w') as f:
-        f.write(HTML_TEMPLATE)
-    
-    print(f"Created template file: {template_path}")
+    with _state_lock:
+        return jsonify({
+            'status': monitoring_data['status'],
+            'last_update': monitoring_data['last_update'],
+            'error': monitoring_data['error']
+        })
 
 def main():
     parser = argparse.ArgumentParser(description='Port Mirroring Monitor Web Application')
@@ -751,10 +583,10 @@ def main():
     parser.add_argument('--rediscover', type=int, default=0, help='Rediscover interval (legacy parameter, ignored)')
     
     args = parser.parse_args()
-    
-    # Create template file
-    create_template_file()
-    
+
+    # Compile the page template at startup instead of on first request
+    app.jinja_env.get_template('index.html')
+
     # Start monitoring thread
     monitoring_thread = threading.Thread(
         target=monitoring_loop, 
@@ -775,9 +607,17 @@ def main():
     print(f"Press Ctrl+C to stop")
     
     try:
-        app.run(host='0.0.0.0', port=args.port, debug=args.debug, threaded=True)
+        if args.debug:
+            # Keep Werkzeug's reloader/debugger for development
+            app.run(host='0.0.0.0', port=args.port, debug=True, threaded=True)
+        else:
+            # Production-grade WSGI server; a few threads are enough since
+            # requests only copy out the pre-serialized snapshot
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=args.port, threads=4)
     except KeyboardInterrupt:
         print("\nShutting down...")
+        stop_event.set()
         if monitor:
             monitor.disconnect()
         sys.exit(0)